@@ -15,12 +15,13 @@ import os
 import subprocess
 import sys
 
+# Same calculation as config.py: os.path.dirname(os.path.dirname(__file__)) -> nexus dir
+NEXUS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def get_logs_dir():
     """Get logs directory, same way config.py does it."""
-    # Same calculation as config.py: os.path.dirname(os.path.dirname(__file__)) -> nexus dir
-    nexus_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(nexus_dir, "logs")
+    return os.path.join(NEXUS_DIR, "logs")
 
 
 def setup_logrotate(install_to_system=False):
@@ -30,8 +31,7 @@ def setup_logrotate(install_to_system=False):
     Args:
         install_to_system: If True, also install to /etc/logrotate.d/nexus
     """
-    nexus_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    template_file = os.path.join(nexus_dir, 'logrotate.conf')
+    template_file = os.path.join(NEXUS_DIR, 'logrotate.conf')
     logs_dir = get_logs_dir()
     
     if not os.path.exists(template_file):